@@ -0,0 +1,216 @@
+import uuid
+import warnings
+from typing import Callable, List, Tuple
+
+from core.schemas.event import Event
+
+
+class AnomalyFilter:
+    """
+    Statistical pre-filter that turns raw metric rows into events.
+
+    For every configured numeric field, each row is compared against a
+    rolling baseline built from the previous `window` rows of the same
+    entity. Only rows whose deviation exceeds `threshold` become events,
+    so no per-dataset static threshold has to be tuned.
+
+    Supported methods:
+      * "mad"  – rolling median / median absolute deviation (robust z-score)
+      * "ewma" – exponentially weighted mean / standard deviation
+
+    Configured from the adapter YAML:
+
+        anomaly_filter:
+          method: mad
+          window: 20
+          threshold: 3.5
+          min_history: 5
+          direction: up          # up | down | both
+          min_spread: 0.0        # absolute floor on the baseline spread
+          min_relative_spread: 0.01  # floor as a fraction of |baseline|
+          chunk_size: 65536      # rows scored per vectorized chunk
+          fields:
+            - field: attributes.latency_ms
+              event_type: latency_spike
+              attributes:
+                latency_ms: attributes.latency_ms
+
+    The spread floors keep quantized metrics (e.g. a window that is mostly
+    100 ms) from turning every small change into an infinite score.
+
+    Requires NumPy, which is imported only when a filter is configured.
+    """
+
+    METHODS = ("mad", "ewma")
+    DIRECTIONS = ("up", "down", "both")
+
+    def __init__(self, config: dict):
+        self.method = config.get("method", "mad")
+        self.window = int(config.get("window", 20))
+        self.threshold = float(config.get("threshold", 3.5))
+        self.min_history = int(config.get("min_history", 5))
+        self.direction = config.get("direction", "up")
+        self.alpha = float(config.get("alpha", 2.0 / (self.window + 1)))
+        self.min_spread = float(config.get("min_spread", 0.0))
+        self.min_relative_spread = float(config.get("min_relative_spread", 0.01))
+        self.chunk_size = int(config.get("chunk_size", 65536))
+        self.fields = config.get("fields", [])
+
+        if self.method not in self.METHODS:
+            raise ValueError(f"Unknown anomaly_filter method: {self.method}")
+        if self.direction not in self.DIRECTIONS:
+            raise ValueError(f"Unknown anomaly_filter direction: {self.direction}")
+        if self.window < 1:
+            raise ValueError("anomaly_filter window must be at least 1")
+        if not 1 <= self.min_history <= self.window:
+            raise ValueError(
+                "anomaly_filter min_history must be between 1 and window "
+                f"({self.window}), got {self.min_history}"
+            )
+        if self.chunk_size < 1:
+            raise ValueError("anomaly_filter chunk_size must be at least 1")
+        for idx, spec in enumerate(self.fields):
+            if not isinstance(spec, dict):
+                raise ValueError(f"anomaly_filter fields[{idx}] must be a mapping")
+            missing = [key for key in ("field", "event_type") if not spec.get(key)]
+            if missing:
+                raise ValueError(
+                    f"anomaly_filter fields[{idx}] is missing {', '.join(missing)}"
+                )
+
+    def filter(
+        self,
+        rows: List[dict],
+        entity_field: str,
+        timestamp_field: str,
+        source: str,
+        get_value: Callable[[dict, str], object],
+        parse_time: Callable[[str], object],
+    ) -> List[Tuple[int, Event]]:
+        """
+        Return (row index, event) pairs for every anomalous row and field,
+        ordered by event time.
+        """
+        import numpy as np
+
+        if not rows or not self.fields:
+            return []
+
+        # ------------------------------------------------------------
+        # Order rows by (entity, time) once for every field
+        # ------------------------------------------------------------
+        times = [parse_time(row[timestamp_field]) for row in rows]
+        entity_names, entity_codes = np.unique(
+            np.array([str(row[entity_field]) for row in rows]), return_inverse=True
+        )
+        order = np.lexsort(
+            (np.array([t.timestamp() for t in times]), entity_codes)
+        )
+        codes = entity_codes[order]
+
+        events = []
+        for spec in self.fields:
+            values = np.fromiter(
+                (self._as_float(get_value(rows[i], spec["field"])) for i in order),
+                dtype=float,
+                count=len(order),
+            )
+            for pos in np.flatnonzero(self._anomalous(values, codes)):
+                row_idx = int(order[pos])
+                row = rows[row_idx]
+                event = Event(
+                    event_id=str(uuid.uuid4()),
+                    timestamp=times[row_idx],
+                    entity_id=row[entity_field],
+                    event_type=spec["event_type"],
+                    source=source,
+                    attributes={
+                        key: get_value(row, path)
+                        for key, path in spec.get("attributes", {}).items()
+                    },
+                )
+                events.append((row_idx, event))
+
+        events.sort(key=lambda item: item[1].timestamp)
+        return events
+
+    def _anomalous(self, values, codes):
+        """
+        Flag anomalous positions in `values`, already sorted by (entity, time).
+
+        Rows are scored in chunks of `chunk_size`, each carrying the previous
+        `window` rows as look-back, so the (rows x window) working arrays are
+        bounded by the chunk size rather than the number of rows.
+        """
+        import numpy as np
+
+        n, w = len(values), self.window
+        flags = np.zeros(n, dtype=bool)
+        for start in range(0, n, self.chunk_size):
+            end = min(start + self.chunk_size, n)
+            lo = max(0, start - w)
+            flags[start:end] = self._anomalous_chunk(
+                values[lo:end], codes[lo:end]
+            )[start - lo:]
+        return flags
+
+    def _anomalous_chunk(self, values, codes):
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        n, w = len(values), self.window
+
+        # Row i of `history` holds the w values preceding i. Values from a
+        # different entity (or padding) are masked out as NaN.
+        padded_values = np.concatenate([np.full(w, np.nan), values])
+        padded_codes = np.concatenate([np.full(w, -1), codes])
+        history = sliding_window_view(padded_values, w)[:n].copy()
+        history[sliding_window_view(padded_codes, w)[:n] != codes[:, None]] = np.nan
+
+        valid = ~np.isnan(history)
+        counts = valid.sum(axis=1)
+
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == "mad":
+                center = np.nanmedian(history, axis=1)
+                spread = 1.4826 * np.nanmedian(
+                    np.abs(history - center[:, None]), axis=1
+                )
+            else:
+                # Most recent value gets the largest weight.
+                weights = (1 - self.alpha) ** np.arange(w - 1, -1, -1)
+                weights = np.where(valid, weights, 0.0)
+                total = weights.sum(axis=1)
+                filled = np.nan_to_num(history)
+                center = (weights * filled).sum(axis=1) / total
+                spread = np.sqrt(
+                    (weights * (filled - center[:, None]) ** 2).sum(axis=1) / total
+                )
+
+            spread = np.fmax(
+                spread,
+                np.fmax(self.min_spread, self.min_relative_spread * np.abs(center)),
+            )
+            deviation = values - center
+            score = np.where(
+                spread > 0,
+                deviation / spread,
+                np.where(deviation != 0, np.sign(deviation) * np.inf, 0.0),
+            )
+
+        if self.direction == "down":
+            score = -score
+        elif self.direction == "both":
+            score = np.abs(score)
+
+        return (counts >= self.min_history) & ~np.isnan(values) & (score > self.threshold)
+
+    @staticmethod
+    def _as_float(value) -> float:
+        if isinstance(value, bool):
+            return float("nan")
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
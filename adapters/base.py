@@ -14,3 +14,25 @@ class DatasetAdapter(ABC):
     @abstractmethod
     def load_incident_meta(self) -> dict:
         pass
+
+    # ------------------------------------------------------------
+    # Async loaders (used by AsyncRCAEngine)
+    #
+    # The defaults run the blocking loaders in a worker thread.
+    # Adapters backed by async clients can override these directly.
+    # asyncio is imported on use to keep synchronous startup cheap.
+    # ------------------------------------------------------------
+    async def aload_events(self) -> List[Event]:
+        import asyncio
+
+        return await asyncio.to_thread(self.load_events)
+
+    async def aload_dependency_graph(self) -> Dict[str, List[str]]:
+        import asyncio
+
+        return await asyncio.to_thread(self.load_dependency_graph)
+
+    async def aload_incident_meta(self) -> dict:
+        import asyncio
+
+        return await asyncio.to_thread(self.load_incident_meta)
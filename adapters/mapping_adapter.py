@@ -1,6 +1,4 @@
 import json
-from os import path
-import yaml
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any
@@ -11,16 +9,41 @@ from core.schemas.event import Event
 
 class MappingBasedAdapter(DatasetAdapter):
     def __init__(self, config_path: str):
+        # Imported lazily so that importing the adapter stays cheap.
+        import yaml
+
         with open(config_path, "r") as f:
             self.config = yaml.safe_load(f)
 
+        self.anomaly_filter = None
+        if self.config.get("anomaly_filter"):
+            from adapters.anomaly_filter import AnomalyFilter
+
+            self.anomaly_filter = AnomalyFilter(self.config["anomaly_filter"])
+
     def load_events(self) -> List[Event]:
         with open(self.config["raw_events_path"], "r") as f:
             rows = json.load(f)
 
+        # Statistical pre-filter first; a static rule never re-emits an
+        # event type the filter already produced for the same row.
+        anomalies = []
+        if self.anomaly_filter is not None:
+            anomalies = self.anomaly_filter.filter(
+                rows,
+                entity_field=self.config["entity_field"],
+                timestamp_field=self.config["timestamp_field"],
+                source=self.config["dataset_name"],
+                get_value=self._get_nested_value,
+                parse_time=self._parse_time,
+            )
+        emitted = {(row_idx, event.event_type) for row_idx, event in anomalies}
+
         events = []
-        for row in rows:
-            for rule in self.config["event_mappings"]:
+        for row_idx, row in enumerate(rows):
+            for rule in self.config.get("event_mappings", []):
+                if (row_idx, rule["event_type"]) in emitted:
+                    continue
                 if self._match_condition(row, rule["condition"]):
                     events.append(
                         Event(
@@ -34,6 +57,8 @@ class MappingBasedAdapter(DatasetAdapter):
                             attributes=self._extract_attributes(row, rule),
                         )
                     )
+
+        events.extend(event for _, event in anomalies)
         return events
 
     def load_dependency_graph(self) -> Dict[str, List[str]]:
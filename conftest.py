@@ -0,0 +1 @@
+# Present so pytest puts the repository root on sys.path for `core` and `adapters`.
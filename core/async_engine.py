@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Dict
+
+from adapters.base import DatasetAdapter
+from core.engine import RCAEngine
+
+if TYPE_CHECKING:
+    from core.memory.repository import MemoryRepository, PooledMemoryRepository
+
+
+class AsyncRCAEngine(RCAEngine):
+    """
+    Asyncio-native RCA Engine.
+
+    Runs the same pipeline as RCAEngine without blocking the event loop:
+    adapter data is loaded through the adapter's async loaders, while the
+    CPU stages, memory persistence and explanation run in an executor.
+
+    Concurrent requests for the same incident_id are coalesced: they all
+    await a single in-flight computation and receive the same result.
+
+    Because stages run on executor threads, `memory` must be a
+    PooledMemoryRepository; the default is the process-wide shared one.
+    """
+
+    def __init__(
+        self,
+        adapter: DatasetAdapter | None = None,
+        memory: "PooledMemoryRepository | None" = None,
+        executor: Executor | None = None,
+        use_memory: bool = True,
+    ):
+        if memory is not None:
+            from core.memory.repository import PooledMemoryRepository
+
+            if not isinstance(memory, PooledMemoryRepository):
+                raise TypeError(
+                    "AsyncRCAEngine runs stages on executor threads and requires "
+                    f"a PooledMemoryRepository, got {type(memory).__name__}"
+                )
+        super().__init__(adapter, memory=memory, use_memory=use_memory)
+        self.executor = executor
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def _default_memory(self) -> "MemoryRepository":
+        # Stages run on executor threads, so memory must be thread-safe.
+        from core.memory.repository import PooledMemoryRepository
+
+        return PooledMemoryRepository.shared()
+
+    async def arun(self, adapter: DatasetAdapter | None = None):
+        """
+        Run RCA for a single incident and persist results to memory.
+
+        `adapter` overrides the engine's default adapter, so one engine can
+        serve many incidents.
+        """
+        adapter = adapter or self.adapter
+        if adapter is None:
+            raise ValueError("AsyncRCAEngine.arun() requires an adapter")
+
+        incident_meta = await adapter.aload_incident_meta()
+        incident_id = incident_meta["incident_id"]
+
+        task = self._in_flight.get(incident_id)
+        if task is None:
+            task = asyncio.ensure_future(self._run_incident(adapter, incident_meta))
+            self._in_flight[incident_id] = task
+            task.add_done_callback(
+                lambda t: self._forget(incident_id, t)
+            )
+
+        # Shield so that one cancelled caller does not cancel the shared run.
+        return await asyncio.shield(task)
+
+    def _forget(self, incident_id: str, task: asyncio.Task):
+        if self._in_flight.get(incident_id) is task:
+            del self._in_flight[incident_id]
+
+    def _analyze_with_graph(self, events, dependency_graph):
+        # Detector construction indexes the whole graph, so it belongs on the
+        # executor rather than the event loop.
+        return self._analyze(events, self._build_detectors(dependency_graph))
+
+    async def _run_incident(self, adapter: DatasetAdapter, incident_meta: dict):
+        loop = asyncio.get_running_loop()
+
+        # ------------------------------------------------------------
+        # Load dataset (async I/O)
+        # ------------------------------------------------------------
+        events, dependency_graph = await asyncio.gather(
+            adapter.aload_events(),
+            adapter.aload_dependency_graph(),
+        )
+
+        # ------------------------------------------------------------
+        # CPU stages: normalization → ranking
+        # ------------------------------------------------------------
+        ranked_results, evidences = await loop.run_in_executor(
+            self.executor, self._analyze_with_graph, events, dependency_graph
+        )
+
+        # ------------------------------------------------------------
+        # Persist RCA run + explanation
+        # ------------------------------------------------------------
+        await loop.run_in_executor(
+            self.executor, self._persist, incident_meta["incident_id"], ranked_results
+        )
+        explanation = await loop.run_in_executor(
+            self.executor, self.reasoner.explain, ranked_results, evidences
+        )
+
+        return {
+            "incident_id": incident_meta["incident_id"],
+            "ranked_root_causes": ranked_results,
+            "explanation": explanation,
+        }
@@ -1,3 +1,6 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from adapters.base import DatasetAdapter
 
 from core.normalization.normalizer import EventNormalizer
@@ -9,7 +12,9 @@ from core.scoring.evidence_builder import EvidenceBuilder
 from core.scoring.weighted_scorer import WeightedScorer
 from core.ranking.ranker import Ranker
 from core.reasoning.explanation_reasoner import ExplanationReasoner
-from core.memory.repository import MemoryRepository
+
+if TYPE_CHECKING:
+    from core.memory.repository import MemoryRepository
 
 
 class RCAEngine:
@@ -21,23 +26,66 @@ class RCAEngine:
     Evidence → Scoring (with priors) → Ranking → Explanation
     """
 
-    def __init__(self, adapter: DatasetAdapter):
+    def __init__(
+        self,
+        adapter: DatasetAdapter,
+        memory: "MemoryRepository | None" = None,
+        use_memory: bool = True,
+    ):
         self.adapter = adapter
 
-        # Core components
-        self.normalizer = EventNormalizer()
-        self.hypothesis_generator = HypothesisGenerator()
-        self.evidence_builder = EvidenceBuilder()
-        self.ranker = Ranker()
-        self.reasoner = ExplanationReasoner()
-
         # Memory + learning (Phase 5)
-        self.memory = MemoryRepository()
-        self.scorer = WeightedScorer(memory_repo=self.memory)
+        # Pass a shared repository (e.g. PooledMemoryRepository.shared())
+        # to reuse one database handle across engines and threads, or
+        # use_memory=False to skip SQLite entirely.
+        self._memory = memory
+        self.use_memory = use_memory
 
         # Pattern detectors (initialized after graph load)
         self.pattern_detectors = []
 
+    # ------------------------------------------------------------
+    # Components are created on first use so that short-lived runs
+    # only pay for what they touch. Each can still be replaced by
+    # plain attribute assignment.
+    # ------------------------------------------------------------
+    @cached_property
+    def normalizer(self) -> EventNormalizer:
+        return EventNormalizer()
+
+    @cached_property
+    def hypothesis_generator(self) -> HypothesisGenerator:
+        return HypothesisGenerator()
+
+    @cached_property
+    def evidence_builder(self) -> EvidenceBuilder:
+        return EvidenceBuilder()
+
+    @cached_property
+    def ranker(self) -> Ranker:
+        return Ranker()
+
+    @cached_property
+    def reasoner(self) -> ExplanationReasoner:
+        return ExplanationReasoner()
+
+    @cached_property
+    def memory(self) -> "MemoryRepository | None":
+        if not self.use_memory:
+            return None
+        if self._memory is not None:
+            return self._memory
+        return self._default_memory()
+
+    @cached_property
+    def scorer(self) -> WeightedScorer:
+        return WeightedScorer(memory_repo=self.memory)
+
+    def _default_memory(self) -> "MemoryRepository":
+        from core.memory.repository import MemoryRepository
+
+        return MemoryRepository()
+
     def run(self):
         """
         Run RCA for a single incident and persist results to memory.
@@ -53,11 +101,40 @@ class RCAEngine:
         # ------------------------------------------------------------
         # Initialize pattern detectors (graph-aware)
         # ------------------------------------------------------------
-        self.pattern_detectors = [
+        self.pattern_detectors = self._build_detectors(dependency_graph)
+
+        ranked_results, evidences = self._analyze(
+            events, self.pattern_detectors
+        )
+
+        # ------------------------------------------------------------
+        # Persist RCA run (Phase 5 memory)
+        # ------------------------------------------------------------
+        self._persist(incident_meta["incident_id"], ranked_results)
+
+        # ------------------------------------------------------------
+        # Deterministic explanation (NO LLM API)
+        # ------------------------------------------------------------
+        explanation = self.reasoner.explain(ranked_results, evidences)
+
+        return {
+            "incident_id": incident_meta["incident_id"],
+            "ranked_root_causes": ranked_results,
+            "explanation": explanation,
+        }
+
+    @staticmethod
+    def _build_detectors(dependency_graph):
+        return [
             TemporalPatternDetector(),
             CorrelationPatternDetector(dependency_graph),
         ]
 
+    def _analyze(self, events, pattern_detectors):
+        """
+        CPU-bound stages: normalization through ranking.
+        """
+
         # ------------------------------------------------------------
         # Normalize events
         # ------------------------------------------------------------
@@ -67,7 +144,7 @@ class RCAEngine:
         # Detect patterns (objective evidence)
         # ------------------------------------------------------------
         patterns = []
-        for detector in self.pattern_detectors:
+        for detector in pattern_detectors:
             patterns.extend(detector.detect(normalized_events))
 
         # ------------------------------------------------------------
@@ -86,10 +163,13 @@ class RCAEngine:
         # ------------------------------------------------------------
         ranked_results = self.ranker.rank(hypotheses, scores)
 
-        # ------------------------------------------------------------
-        # Persist RCA run (Phase 5 memory)
-        # ------------------------------------------------------------
-        run_id = self.memory.start_run(incident_meta["incident_id"])
+        return ranked_results, evidences
+
+    def _persist(self, incident_id, ranked_results):
+        if self.memory is None:
+            return None
+
+        run_id = self.memory.start_run(incident_id)
 
         for rank, hypothesis, score in ranked_results:
             self.memory.save_result(
@@ -99,14 +179,4 @@ class RCAEngine:
                 rank=rank,
                 score=score,
             )
-
-        # ------------------------------------------------------------
-        # Deterministic explanation (NO LLM API)
-        # ------------------------------------------------------------
-        explanation = self.reasoner.explain(ranked_results, evidences)
-
-        return {
-            "incident_id": incident_meta["incident_id"],
-            "ranked_root_causes": ranked_results,
-            "explanation": explanation,
-        }
+        return run_id
@@ -1,25 +1,74 @@
+import os
+import queue
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from importlib import resources
+
+
+def default_db_path() -> str:
+    """
+    Resolve the default database location when a repository is created.
+
+    RCA_MEMORY_DB wins if set; otherwise the database lives in the user data
+    directory rather than the current working directory.
+    """
+    path = os.environ.get("RCA_MEMORY_DB")
+    if path:
+        return path
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(
+            os.path.join("~", ".local", "share")
+        )
+    directory = os.path.join(base, "rca-engine")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "rca_memory.db")
+
+# Bump together with the `PRAGMA user_version` line in schema.sql.
+SCHEMA_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _schema_sql() -> str:
+    return resources.files(__package__).joinpath("schema.sql").read_text()
 
 
 class MemoryRepository:
-    def __init__(self, db_path="rca_memory.db"):
-        self.conn = sqlite3.connect(db_path)
+    def __init__(self, db_path=None):
+        self.db_path = db_path or default_db_path()
+        self.conn = sqlite3.connect(self.db_path)
         self._init_schema()
 
     def _init_schema(self):
-        with open("core/memory/schema.sql", "r") as f:
-            self.conn.executescript(f.read())
+        # Reading user_version is far cheaper than re-running the script, and
+        # unlike a per-process cache it notices a deleted or rotated file.
+        with self._writer() as conn:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != SCHEMA_VERSION:
+                conn.executescript(_schema_sql())
+
+    @contextmanager
+    def _reader(self):
+        yield self.conn
+
+    @contextmanager
+    def _writer(self):
+        yield self.conn
         self.conn.commit()
 
     def start_run(self, incident_id: str) -> str:
         run_id = str(uuid.uuid4())
-        self.conn.execute(
-            "INSERT INTO rca_runs VALUES (?, ?, ?)",
-            (run_id, incident_id, datetime.utcnow().isoformat()),
-        )
-        self.conn.commit()
+        with self._writer() as conn:
+            conn.execute(
+                "INSERT INTO rca_runs VALUES (?, ?, ?)",
+                (run_id, incident_id, datetime.utcnow().isoformat()),
+            )
         return run_id
 
     def save_result(
@@ -31,69 +80,195 @@ class MemoryRepository:
         score: float,
         confirmed: int | None = None,
     ):
-        self.conn.execute(
-            "INSERT INTO rca_results VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                str(uuid.uuid4()),
-                run_id,
-                hypothesis_category,
-                hypothesis_entity,
-                rank,
-                score,
-                confirmed,
-            ),
-        )
-        self.conn.commit()
+        with self._writer() as conn:
+            conn.execute(
+                "INSERT INTO rca_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(uuid.uuid4()),
+                    run_id,
+                    hypothesis_category,
+                    hypothesis_entity,
+                    rank,
+                    score,
+                    confirmed,
+                ),
+            )
 
     def update_prior(self, category: str, entity: str, success: bool):
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT success_count, failure_count
-            FROM hypothesis_priors
-            WHERE hypothesis_category=? AND hypothesis_entity=?
-            """,
-            (category, entity),
-        )
-        row = cur.fetchone()
-
-        if row is None:
-            success_count = 1 if success else 0
-            failure_count = 0 if success else 1
-            self.conn.execute(
-                "INSERT INTO hypothesis_priors VALUES (?, ?, ?, ?)",
-                (category, entity, success_count, failure_count),
-            )
-        else:
-            success_count, failure_count = row
-            if success:
-                success_count += 1
-            else:
-                failure_count += 1
-            self.conn.execute(
+        with self._writer() as conn:
+            cur = conn.cursor()
+            cur.execute(
                 """
-                UPDATE hypothesis_priors
-                SET success_count=?, failure_count=?
+                SELECT success_count, failure_count
+                FROM hypothesis_priors
                 WHERE hypothesis_category=? AND hypothesis_entity=?
                 """,
-                (success_count, failure_count, category, entity),
+                (category, entity),
             )
-        self.conn.commit()
+            row = cur.fetchone()
+
+            if row is None:
+                success_count = 1 if success else 0
+                failure_count = 0 if success else 1
+                conn.execute(
+                    "INSERT INTO hypothesis_priors VALUES (?, ?, ?, ?)",
+                    (category, entity, success_count, failure_count),
+                )
+            else:
+                success_count, failure_count = row
+                if success:
+                    success_count += 1
+                else:
+                    failure_count += 1
+                conn.execute(
+                    """
+                    UPDATE hypothesis_priors
+                    SET success_count=?, failure_count=?
+                    WHERE hypothesis_category=? AND hypothesis_entity=?
+                    """,
+                    (success_count, failure_count, category, entity),
+                )
 
     def get_prior_weight(self, category: str, entity: str) -> float:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT success_count, failure_count
-            FROM hypothesis_priors
-            WHERE hypothesis_category=? AND hypothesis_entity=?
-            """,
-            (category, entity),
-        )
-        row = cur.fetchone()
+        with self._reader() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                SELECT success_count, failure_count
+                FROM hypothesis_priors
+                WHERE hypothesis_category=? AND hypothesis_entity=?
+                """,
+                (category, entity),
+            )
+            row = cur.fetchone()
 
         if row is None:
             return 1.0  # neutral prior
 
         success, failure = row
         return (success + 1) / (success + failure + 2)
+
+    def get_explanation(self, fingerprint: str) -> str | None:
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT explanation FROM explanation_cache WHERE fingerprint=?",
+                (fingerprint,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_explanation(self, fingerprint: str, explanation: str):
+        with self._writer() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO explanation_cache VALUES (?, ?, ?)",
+                (fingerprint, explanation, datetime.utcnow().isoformat()),
+            )
+
+
+class PooledMemoryRepository(MemoryRepository):
+    """
+    Thread-safe memory repository for concurrent services.
+
+    All writes go through a single connection guarded by a lock, while reads
+    borrow a connection from a bounded pool of `pool_size` readers. File
+    databases run in WAL mode so readers never block on the writer.
+
+    An in-memory database cannot be shared safely between connections, so
+    ":memory:" routes every read and write through the locked writer.
+
+    Use `PooledMemoryRepository.shared(db_path)` to reuse one instance across
+    every engine in the process.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path=None, pool_size: int = 8):
+        self.db_path = db_path or default_db_path()
+        self.pool_size = pool_size
+        self._in_memory = self.db_path == ":memory:"
+
+        self._write_lock = threading.Lock()
+        self._idle_readers = queue.LifoQueue()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+        self.conn = self._connect()
+        if not self._in_memory:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    @staticmethod
+    def _shared_key(db_path) -> str:
+        return db_path if db_path == ":memory:" else os.path.abspath(db_path)
+
+    @classmethod
+    def shared(cls, db_path=None) -> "PooledMemoryRepository":
+        """
+        Return the process-wide repository for `db_path`, creating it once.
+        """
+        db_path = db_path or default_db_path()
+        key = cls._shared_key(db_path)
+        with cls._shared_lock:
+            repo = cls._shared.get(key)
+            if repo is None:
+                repo = cls(db_path)
+                cls._shared[key] = repo
+            return repo
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._readers_lock:
+            if len(self._readers) < self.pool_size:
+                conn = self._connect()
+                self._readers.append(conn)
+                return conn
+
+        # Pool exhausted: wait for another thread to return a connection.
+        return self._idle_readers.get()
+
+    @contextmanager
+    def _reader(self):
+        if self._in_memory:
+            with self._write_lock:
+                yield self.conn
+            return
+
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put(conn)
+
+    @contextmanager
+    def _writer(self):
+        with self._write_lock:
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+
+    def close(self):
+        cls = type(self)
+        with cls._shared_lock:
+            key = self._shared_key(self.db_path)
+            if cls._shared.get(key) is self:
+                del cls._shared[key]
+
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._idle_readers = queue.LifoQueue()
+        self.conn.close()
@@ -22,3 +22,11 @@ CREATE TABLE IF NOT EXISTS hypothesis_priors (
     failure_count INTEGER,
     PRIMARY KEY (hypothesis_category, hypothesis_entity)
 );
+
+CREATE TABLE IF NOT EXISTS explanation_cache (
+    fingerprint TEXT PRIMARY KEY,
+    explanation TEXT,
+    created_at TEXT
+);
+
+PRAGMA user_version = 1;
@@ -1,39 +1,94 @@
 import uuid
+from collections import defaultdict
+from functools import lru_cache
 from typing import List
 from core.schemas.pattern import Pattern
 from core.schemas.normalized_event import NormalizedEvent
 from core.pattern_detection.base import PatternDetector
+from core.pattern_detection.dependency_basic import DependencyAnalyzer
+
+
+@lru_cache(maxsize=16)
+def _cached_reachability(graph_key: tuple, max_hops: int) -> dict:
+    graph = {node: list(upstreams) for node, upstreams in graph_key}
+    return DependencyAnalyzer(graph).reachability_index(max_hops)
+
+
+def reachability_index(dependency_graph: dict, max_hops: int) -> dict:
+    """
+    Bounded reachability index, shared between detectors built from the
+    same graph. The returned mapping must be treated as read-only.
+    """
+    graph_key = tuple(
+        sorted((node, tuple(upstreams)) for node, upstreams in dependency_graph.items())
+    )
+    return _cached_reachability(graph_key, max_hops)
 
 
 class CorrelationPatternDetector(PatternDetector):
-    def __init__(self, dependency_graph: dict):
+    def __init__(
+        self,
+        dependency_graph: dict,
+        max_hops: int = 3,
+        base_confidence: float = 0.6,
+        hop_decay: float = 0.5,
+    ):
         self.graph = dependency_graph
+        self.max_hops = max_hops
+        self.base_confidence = base_confidence
+        self.hop_decay = hop_decay
+        # entity -> {upstream entity: hop distance}, bounded by max_hops
+        self.reachability = reachability_index(dependency_graph, max_hops)
 
     def detect(self, events: List[NormalizedEvent]) -> List[Pattern]:
         patterns = []
+        by_entity = defaultdict(list)
 
         for e in events:
-            upstreams = self.graph.get(e.entity, [])
-            for u in upstreams:
-                for other in events:
-                    if other.entity == u:
-                        patterns.append(
-                            Pattern(
-                                pattern_id=str(uuid.uuid4()),
-                                pattern_type="correlation",
-                                description=(
-                                    f"Failure propagated from {e.entity} "
-                                    f"to upstream service {u}"
-                                ),
-                                confidence=0.6,
-                                supporting_event_ids=[
-                                    e.normalized_event_id,
-                                    other.normalized_event_id,
-                                ],
-                            )
-                        )
+            by_entity[e.entity].append(e)
+
+        # candidate root -> [(hops, impacted entity)] over failing entities
+        impacted_by_root = defaultdict(list)
+        for entity in by_entity:
+            for u, hops in self.reachability.get(entity, {}).items():
+                if u in by_entity:
+                    impacted_by_root[u].append((hops, entity))
+
+        # One pattern per candidate root, aggregating every impacted entity
+        # and combining their hop-decayed confidences with a noisy-OR so that
+        # more or closer failing downstreams give stronger support.
+        for u, impacted in impacted_by_root.items():
+            impacted.sort()
+            miss = 1.0
+            for hops, _ in impacted:
+                miss *= 1.0 - self.base_confidence * self.hop_decay ** (hops - 1)
+            supporting = [
+                e.normalized_event_id
+                for _, entity in impacted
+                for e in by_entity[entity]
+            ]
+            supporting.extend(e.normalized_event_id for e in by_entity[u])
+
+            patterns.append(
+                Pattern(
+                    pattern_id=str(uuid.uuid4()),
+                    pattern_type="correlation",
+                    description=self._describe(impacted, u),
+                    confidence=round(1.0 - miss, 4),
+                    supporting_event_ids=supporting,
+                )
+            )
         return patterns
 
+    def _describe(self, impacted: list, upstream: str) -> str:
+        # The upstream entity must stay the last token; HypothesisGenerator
+        # reads it from there.
+        sources = ", ".join(
+            entity if hops == 1 else f"{entity} ({hops} hops)"
+            for hops, entity in impacted
+        )
+        return f"Failure propagated from {sources} to upstream service {upstream}"
+
 
 """
 Correlation pattern detector.
@@ -42,6 +97,12 @@ Identifies failure events that share common attributes such as dependencies
 or dimensions. Correlated failures provide evidence that multiple anomalies
 may be related to the same underlying factor.
 
+Failures are linked through transitive upstream chains up to `max_hops`
+away, using a reachability index precomputed from the dependency graph.
+Confidence decays by `hop_decay` for every hop beyond the first. One pattern
+is emitted per candidate root, aggregating all failing entities it impacts;
+their decayed confidences are combined as a noisy-OR.
+
 Correlation patterns are later combined with temporal and structural evidence
 to assess root cause likelihood.
 """
@@ -1,5 +1,5 @@
 from collections import deque
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 class DependencyAnalyzer:
     def __init__(self, graph: Dict[str, List[str]]):
@@ -24,6 +24,61 @@ class DependencyAnalyzer:
 
         return None
 
+    def reachable(self, source: str, max_hops: int) -> Dict[str, int]:
+        """
+        Return every node reachable from `source` within `max_hops`,
+        mapped to its shortest hop distance.
+        """
+        distances = {}
+        visited = {source}
+        frontier = [source]
+
+        for hop in range(1, max_hops + 1):
+            next_frontier = []
+            for node in frontier:
+                for nxt in self.graph.get(node, []):
+                    if nxt not in visited:
+                        visited.add(nxt)
+                        distances[nxt] = hop
+                        next_frontier.append(nxt)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return distances
+
+    def reachability_index(self, max_hops: int) -> Dict[str, Dict[str, int]]:
+        """
+        Precompute bounded-depth reachability for every node in the graph.
+        """
+        return {node: self.reachable(node, max_hops) for node in self.graph}
+
+    def connected_components(self) -> List[Set[str]]:
+        """
+        Split the graph into weakly connected components, treating every
+        dependency edge as undirected.
+        """
+        parent = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for node, upstreams in self.graph.items():
+            find(node)
+            for nxt in upstreams:
+                root_a, root_b = find(node), find(nxt)
+                if root_a != root_b:
+                    parent[root_b] = root_a
+
+        components = {}
+        for node in parent:
+            components.setdefault(find(node), set()).add(node)
+        return list(components.values())
+
 """
 Dependency proximity analyzer.
 
@@ -0,0 +1,102 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ExplanationCache:
+    """
+    LRU cache of rendered explanations keyed by root-cause signature.
+
+    The signature is a fingerprint of the top-K ranked hypotheses, their
+    scores and their evidence facts, salted with a namespace identifying the
+    reasoner that produced the text. An optional MemoryRepository adds a
+    persistent tier shared across processes and restarts.
+    """
+
+    def __init__(self, max_size: int = 1024, top_k: int = 3, memory_repo=None):
+        self.max_size = max_size
+        self.top_k = top_k
+        self.memory_repo = memory_repo
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, ranked_results, evidences, namespace: str = "") -> str:
+        facts_by_id = {e.hypothesis_id: e.facts for e in evidences or []}
+        digest = hashlib.sha256(namespace.encode())
+        for rank, hypothesis, score in ranked_results[: self.top_k]:
+            digest.update(
+                repr(
+                    (
+                        rank,
+                        hypothesis.category,
+                        hypothesis.description,
+                        score,
+                        sorted(facts_by_id.get(hypothesis.hypothesis_id, [])),
+                    )
+                ).encode()
+            )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            explanation = self._entries.get(key)
+            if explanation is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return explanation
+
+        if self.memory_repo is not None:
+            explanation = self.memory_repo.get_explanation(key)
+            if explanation is not None:
+                self._store(key, explanation)
+                with self._lock:
+                    self.hits += 1
+                return explanation
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, explanation: str):
+        self._store(key, explanation)
+        if self.memory_repo is not None:
+            self.memory_repo.save_explanation(key, explanation)
+
+    def _store(self, key: str, explanation: str):
+        with self._lock:
+            self._entries[key] = explanation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class CachedReasoner:
+    """
+    Wraps any reasoner exposing `explain(ranked_results, evidences)` so that
+    incidents with the same root-cause signature reuse the first explanation.
+
+    Entries are namespaced by the reasoner's qualified class name and its
+    optional `cache_version` attribute, so swapping reasoners over a shared
+    persistent tier never returns another reasoner's text.
+    """
+
+    def __init__(self, reasoner, cache: ExplanationCache | None = None):
+        self.reasoner = reasoner
+        self.cache = cache or ExplanationCache()
+        cls = type(reasoner)
+        self.namespace = (
+            f"{cls.__module__}.{cls.__qualname__}:"
+            f"{getattr(reasoner, 'cache_version', '')}"
+        )
+
+    def explain(self, ranked_results, evidences=None):
+        key = self.cache.fingerprint(
+            ranked_results, evidences, namespace=self.namespace
+        )
+        explanation = self.cache.get(key)
+        if explanation is None:
+            explanation = self.reasoner.explain(ranked_results, evidences)
+            self.cache.put(key, explanation)
+        return explanation
@@ -1,3 +1,7 @@
+import hashlib
+from string import Template
+
+
 class ExplanationReasoner:
     """
     Generates human-readable RCA explanations from ranked hypotheses
@@ -5,22 +9,68 @@ class ExplanationReasoner:
 
     This is a deterministic, LLM-free reasoning layer.
     Can be replaced by a real LLM later without changing the engine.
+
+    Explanations are rendered from templates compiled once per class;
+    pass `templates` to override any of them.
     """
 
+    TEMPLATES = {
+        "summary": Template(
+            "The most likely root cause is '$category'. $description. "
+        ),
+        "facts": Template(
+            "This conclusion is based on the following evidence: $facts. "
+        ),
+        "generic": Template(
+            "This conclusion is based on multiple corroborating signals "
+            "such as temporal clustering of failures, correlation patterns, "
+            "and structural context from the dependency graph. "
+        ),
+        "confidence": Template(
+            "The confidence score of $score indicates stronger support "
+            "compared to alternative hypotheses."
+        ),
+        "no_result": Template(
+            "No root cause could be determined due to insufficient evidence."
+        ),
+    }
+
+    def __init__(self, templates=None):
+        self.templates = dict(self.TEMPLATES)
+        for name, text in (templates or {}).items():
+            self.templates[name] = text if isinstance(text, Template) else Template(text)
+
+    @property
+    def cache_version(self) -> str:
+        """
+        Identifies the template set, so cached explanations are not reused
+        after the templates change.
+        """
+        digest = hashlib.sha256()
+        for name in sorted(self.templates):
+            digest.update(f"{name}={self.templates[name].template}".encode())
+        return digest.hexdigest()[:16]
+
     def explain(self, ranked_results, evidences):
         if not ranked_results:
-            return "No root cause could be determined due to insufficient evidence."
+            return self.templates["no_result"].substitute()
 
         rank, hypothesis, score = ranked_results[0]
+        evidence = next(
+            (e for e in evidences or [] if e.hypothesis_id == hypothesis.hypothesis_id),
+            None,
+        )
 
-        explanation = (
-            f"The most likely root cause is '{hypothesis.category}'. "
-            f"{hypothesis.description}. "
-            f"This conclusion is based on multiple corroborating signals "
-            f"such as temporal clustering of failures, correlation patterns, "
-            f"and structural context from the dependency graph. "
-            f"The confidence score of {score} indicates stronger support "
-            f"compared to alternative hypotheses."
+        explanation = self.templates["summary"].substitute(
+            category=hypothesis.category,
+            description=hypothesis.description,
         )
+        if evidence is not None and evidence.facts:
+            explanation += self.templates["facts"].substitute(
+                facts="; ".join(dict.fromkeys(evidence.facts)),
+            )
+        else:
+            explanation += self.templates["generic"].substitute()
+        explanation += self.templates["confidence"].substitute(score=score)
 
         return explanation
@@ -1,5 +1,5 @@
 class LLMReasoner:
-    def explain(self, ranked_results):
+    def explain(self, ranked_results, evidences=None):
         top = ranked_results[0]
         _, hypothesis, score = top
 
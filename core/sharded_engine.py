@@ -0,0 +1,187 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from typing import Dict, List, Set
+
+from adapters.base import DatasetAdapter
+from core.engine import RCAEngine
+from core.pattern_detection.dependency_basic import DependencyAnalyzer
+from core.schemas.event import Event
+
+
+def _analyze_shard(components, events, dependency_graph):
+    """
+    Normalization → evidence for one shard.
+
+    Module-level so it can run in a worker process. Scoring stays in the
+    parent because it reads priors from memory.
+    """
+    normalizer, detector_factory, hypothesis_generator, evidence_builder = components
+
+    normalized_events = normalizer.normalize(events)
+
+    patterns = []
+    for detector in detector_factory(dependency_graph):
+        patterns.extend(detector.detect(normalized_events))
+
+    hypotheses = hypothesis_generator.generate(patterns)
+    evidences = evidence_builder.build(hypotheses, patterns)
+    return hypotheses, evidences
+
+
+class ShardedRCAEngine(RCAEngine):
+    """
+    RCA Engine for very large incidents.
+
+    Splits the dependency graph into weakly connected components, partitions
+    events by component, and runs normalization, pattern detection,
+    hypotheses and evidence for each shard in parallel. Shard results are
+    scored and merged into a single global ranking.
+
+    Failures in different components can never be linked by the detectors,
+    so the merged ranking matches an unsharded run. Shards are streamed to
+    the executor with at most `max_workers` in flight, and each shard's
+    events are released once submitted, so normalized events and patterns
+    only exist for the shards currently being analyzed. The raw events
+    returned by the adapter, and the scored hypotheses and evidence of
+    every shard, are still held by the parent process.
+    """
+
+    def __init__(
+        self,
+        adapter: DatasetAdapter,
+        memory=None,
+        use_memory: bool = True,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+    ):
+        super().__init__(adapter, memory=memory, use_memory=use_memory)
+        self.executor = executor
+        self.max_workers = max_workers
+
+    def run(self):
+        """
+        Run sharded RCA for a single incident and persist results to memory.
+        """
+        events = self.adapter.load_events()
+        dependency_graph = self.adapter.load_dependency_graph()
+        incident_meta = self.adapter.load_incident_meta()
+
+        shards = self.partition(events, dependency_graph)
+        shard_count = len(shards)
+        # Shard lists now own the events; drop the flat copy.
+        del events
+
+        # ------------------------------------------------------------
+        # Score each shard as it completes, then merge into a global
+        # ranking in shard order so results are deterministic.
+        # ------------------------------------------------------------
+        merged = [None] * shard_count
+        scores = {}
+        for idx, shard_hypotheses, shard_evidences in self._iter_shard_results(shards):
+            scores.update(self.scorer.score(shard_evidences, shard_hypotheses))
+            merged[idx] = (shard_hypotheses, shard_evidences)
+
+        hypotheses, evidences = [], []
+        for shard_hypotheses, shard_evidences in merged:
+            hypotheses.extend(shard_hypotheses)
+            evidences.extend(shard_evidences)
+
+        ranked_results = self.ranker.rank(hypotheses, scores)
+
+        self._persist(incident_meta["incident_id"], ranked_results)
+        explanation = self.reasoner.explain(ranked_results, evidences)
+
+        return {
+            "incident_id": incident_meta["incident_id"],
+            "ranked_root_causes": ranked_results,
+            "explanation": explanation,
+            "shards": shard_count,
+        }
+
+    def partition(
+        self,
+        events: List[Event],
+        dependency_graph: Dict[str, List[str]],
+    ) -> List[tuple]:
+        """
+        Group events by weakly connected component of the dependency graph.
+
+        Returns (events, subgraph) pairs for components with at least one
+        event. Entities missing from the graph form their own shard.
+        """
+        components: List[Set[str]] = DependencyAnalyzer(
+            dependency_graph
+        ).connected_components()
+        shard_of = {}
+        for idx, component in enumerate(components):
+            for node in component:
+                shard_of[node] = idx
+
+        shard_events: Dict[int, List[Event]] = {}
+        for event in events:
+            idx = shard_of.get(event.entity_id)
+            if idx is None:
+                idx = shard_of[event.entity_id] = len(components)
+                components.append({event.entity_id})
+            shard_events.setdefault(idx, []).append(event)
+
+        return [
+            (
+                evs,
+                {
+                    node: dependency_graph[node]
+                    for node in components[idx]
+                    if node in dependency_graph
+                },
+            )
+            for idx, evs in shard_events.items()
+        ]
+
+    def _iter_shard_results(self, shards):
+        """
+        Yield (shard index, hypotheses, evidences) as shards complete.
+
+        Consumes `shards`: each entry is removed from the list when it is
+        submitted so its events can be freed as soon as the worker is done.
+        """
+        components = (
+            self.normalizer,
+            self._build_detectors,
+            self.hypothesis_generator,
+            self.evidence_builder,
+        )
+        # Largest shards first keeps workers busy until the end.
+        pending = sorted(
+            range(len(shards)), key=lambda idx: len(shards[idx][0])
+        )
+
+        if len(shards) <= 1:
+            while pending:
+                idx = pending.pop()
+                evs, graph = shards[idx]
+                shards[idx] = None
+                yield (idx, *_analyze_shard(components, evs, graph))
+            return
+
+        workers = self.max_workers or os.cpu_count() or 1
+        executor = self.executor or ProcessPoolExecutor(max_workers=workers)
+        in_flight = {}
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < workers:
+                    idx = pending.pop()
+                    evs, graph = shards[idx]
+                    shards[idx] = None
+                    future = executor.submit(_analyze_shard, components, evs, graph)
+                    in_flight[future] = idx
+                    del evs, graph
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = in_flight.pop(future)
+                    yield (idx, *future.result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if self.executor is None:
+                executor.shutdown()
@@ -0,0 +1,78 @@
+"""
+Benchmark concurrent scoring readers against a shared PooledMemoryRepository.
+
+Usage:
+    python -m examples.bench_memory_pool
+"""
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from core.memory.repository import PooledMemoryRepository
+from core.schemas.evidence import Evidence
+from core.schemas.hypothesis import Hypothesis
+from core.scoring.weighted_scorer import WeightedScorer
+
+
+N_HYPOTHESES = 50
+N_ROUNDS = 200
+
+
+def _build_inputs():
+    hypotheses, evidences = [], []
+    for i in range(N_HYPOTHESES):
+        h = Hypothesis(
+            hypothesis_id=str(uuid.uuid4()),
+            category="service_degradation",
+            description=f"Service service-{i} experienced internal degradation",
+            generated_by="rules",
+            related_pattern_ids=[],
+        )
+        hypotheses.append(h)
+        evidences.append(
+            Evidence(
+                hypothesis_id=h.hypothesis_id,
+                temporal_alignment=0.6,
+                correlation_strength=0.3,
+                causal_proximity=0.5,
+                signal_confidence=0.9,
+                facts=[],
+            )
+        )
+    return evidences, hypotheses
+
+
+def _score_rounds(scorer, evidences, hypotheses):
+    for _ in range(N_ROUNDS):
+        scorer.score(evidences, hypotheses)
+
+
+def main():
+    db_path = os.path.join(tempfile.mkdtemp(), "bench_memory.db")
+    memory = PooledMemoryRepository.shared(db_path)
+    evidences, hypotheses = _build_inputs()
+
+    for h in hypotheses:
+        memory.update_prior(h.category, h.description, success=True)
+
+    scorer = WeightedScorer(memory_repo=memory)
+
+    for workers in (1, 2, 4, 8, 16):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in range(workers):
+                pool.submit(_score_rounds, scorer, evidences, hypotheses)
+        elapsed = time.perf_counter() - start
+        lookups = workers * N_ROUNDS * N_HYPOTHESES
+        print(
+            f"workers={workers:<3} lookups={lookups:<7} "
+            f"elapsed={elapsed:.3f}s  rate={lookups / elapsed:,.0f}/s"
+        )
+
+    memory.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark import time and cold-start latency of the RCA engine.
+
+Every measurement runs in a fresh interpreter so module caches and the
+per-process schema cache start empty.
+
+Usage:
+    python -m examples.bench_startup
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+
+REPEATS = 10
+
+SCENARIOS = {
+    "import core.engine": "import core.engine",
+    "import adapter + engine": (
+        "import adapters.mapping_adapter, core.engine"
+    ),
+    "construct engine": (
+        "from core.engine import RCAEngine\n"
+        "RCAEngine(adapter=None)"
+    ),
+    "run (memory disabled)": (
+        "from adapters.mapping_adapter import MappingBasedAdapter\n"
+        "from core.engine import RCAEngine\n"
+        "adapter = MappingBasedAdapter('adapters/configs/synthetic.yaml')\n"
+        "RCAEngine(adapter=adapter, use_memory=False).run()"
+    ),
+    "run (in-memory SQLite)": (
+        "from adapters.mapping_adapter import MappingBasedAdapter\n"
+        "from core.engine import RCAEngine\n"
+        "from core.memory.repository import MemoryRepository\n"
+        "adapter = MappingBasedAdapter('adapters/configs/synthetic.yaml')\n"
+        "RCAEngine(adapter=adapter, memory=MemoryRepository(':memory:')).run()"
+    ),
+}
+
+
+def _time_subprocess(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    baseline = statistics.median(
+        _time_subprocess("pass") for _ in range(REPEATS)
+    )
+    print(f"{'interpreter startup':<28} {baseline * 1000:8.1f} ms")
+
+    for name, code in SCENARIOS.items():
+        elapsed = statistics.median(
+            _time_subprocess(code) for _ in range(REPEATS)
+        )
+        print(
+            f"{name:<28} {elapsed * 1000:8.1f} ms "
+            f"(+{(elapsed - baseline) * 1000:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import yaml
+
+np = pytest.importorskip("numpy")
+
+from adapters.anomaly_filter import AnomalyFilter
+from adapters.mapping_adapter import MappingBasedAdapter
+
+
+T0 = datetime(2025, 1, 1, 9, 0)
+
+
+def _rows(series, entity="service-A", offset=0, step=2):
+    return [
+        {
+            "timestamp": (T0 + timedelta(seconds=offset + step * i)).isoformat() + "Z",
+            "entity_id": entity,
+            "attributes": {"latency_ms": value},
+        }
+        for i, value in enumerate(series)
+    ]
+
+
+def _filter(rows, **config):
+    config.setdefault(
+        "fields", [{"field": "attributes.latency_ms", "event_type": "latency_spike"}]
+    )
+    adapter = MappingBasedAdapter.__new__(MappingBasedAdapter)
+    return AnomalyFilter(config).filter(
+        rows,
+        entity_field="entity_id",
+        timestamp_field="timestamp",
+        source="test",
+        get_value=adapter._get_nested_value,
+        parse_time=adapter._parse_time,
+    )
+
+
+def _flagged(results, rows):
+    return [rows[idx]["attributes"]["latency_ms"] for idx, _ in results]
+
+
+QUANTIZED = [100, 101, 100, 100, 100, 101, 100, 100, 101, 100] * 5
+QUANTIZED_WITH_SPIKE = QUANTIZED[:30] + [5000] + QUANTIZED[30:]
+
+
+@pytest.mark.parametrize("method", ["mad", "ewma"])
+def test_quantized_series_only_flags_spike(method):
+    rows = _rows(QUANTIZED_WITH_SPIKE)
+    assert _flagged(_filter(rows, method=method), rows) == [5000]
+
+
+def test_zero_spread_without_floor_flags_every_change():
+    rows = _rows([100] * 10 + [101])
+    assert _flagged(_filter(rows, min_relative_spread=0.0), rows) == [101]
+    assert _filter(rows) == []
+
+
+def test_absolute_spread_floor():
+    rows = _rows([100] * 10 + [110])
+    assert _flagged(_filter(rows), rows) == [110]
+    assert _filter(rows, min_spread=5.0) == []
+
+
+def test_interleaved_entities_do_not_share_baselines():
+    # service-B runs at ~5000 ms; interleaved with service-A at ~100 ms.
+    fast = _rows(QUANTIZED, entity="service-A", offset=0)
+    slow = _rows([5000 + v - 100 for v in QUANTIZED], entity="service-B", offset=1)
+    rows = [row for pair in zip(fast, slow) for row in pair]
+
+    assert _filter(rows, direction="both") == []
+
+    rows[41]["attributes"]["latency_ms"] = 100  # service-B drops to A's level
+    for chunk_size in (65536, 7):
+        results = _filter(rows, direction="both", chunk_size=chunk_size)
+        assert [(i, e.entity_id) for i, e in results] == [(41, "service-B")]
+
+
+def test_direction():
+    rows = _rows(QUANTIZED[:20] + [10] + QUANTIZED[20:30] + [5000])
+    assert _flagged(_filter(rows, direction="up"), rows) == [5000]
+    assert _flagged(_filter(rows, direction="down"), rows) == [10]
+    assert sorted(_flagged(_filter(rows, direction="both"), rows)) == [10, 5000]
+
+
+def test_ewma_weights_recent_history():
+    # The level shifts from 100 to 200; with a long window, MAD's median still
+    # sits at 100 while EWMA has already adapted to the new level.
+    series = [100, 101] * 10 + [200, 201] * 5 + [205]
+    rows = _rows(series)
+    assert 205 in _flagged(_filter(rows, method="mad", window=30), rows)
+
+    ewma = _flagged(_filter(rows, method="ewma", window=30, alpha=0.5), rows)
+    assert ewma == [200]  # only the shift itself
+
+
+def test_min_history():
+    rows = _rows([100] * 5 + [5000])
+    assert _flagged(_filter(rows, min_history=5), rows) == [5000]
+    assert _filter(rows, min_history=6) == []
+
+
+def test_chunking_matches_single_pass():
+    rows = _rows(QUANTIZED_WITH_SPIKE)
+    flagged = _flagged(_filter(rows, window=20, chunk_size=7), rows)
+    assert flagged == _flagged(_filter(rows, window=20), rows) == [5000]
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"method": "zscore"}, "method"),
+        ({"direction": "sideways"}, "direction"),
+        ({"window": 0}, "window"),
+        ({"window": 5, "min_history": 6}, "min_history"),
+        ({"chunk_size": 0}, "chunk_size"),
+        ({"fields": [{"event_type": "latency_spike"}]}, "missing field"),
+        ({"fields": [{"field": "attributes.latency_ms"}]}, "missing event_type"),
+    ],
+)
+def test_invalid_config(config, message):
+    with pytest.raises(ValueError, match=message):
+        AnomalyFilter(config)
+
+
+def test_static_rule_skipped_when_filter_emitted_same_type(tmp_path):
+    rows = _rows(QUANTIZED_WITH_SPIKE)
+    (tmp_path / "raw.json").write_text(json.dumps(rows))
+    config = {
+        "dataset_name": "test",
+        "raw_events_path": str(tmp_path / "raw.json"),
+        "timestamp_field": "timestamp",
+        "entity_field": "entity_id",
+        "event_mappings": [
+            {
+                "condition": {"field": "attributes.latency_ms", "op": ">", "value": 3000},
+                "event_type": "latency_spike",
+            },
+            {
+                "condition": {"field": "attributes.latency_ms", "op": ">", "value": 3000},
+                "event_type": "request_failure",
+            },
+        ],
+        "anomaly_filter": {
+            "fields": [{"field": "attributes.latency_ms", "event_type": "latency_spike"}]
+        },
+    }
+    (tmp_path / "config.yaml").write_text(yaml.safe_dump(config))
+
+    events = MappingBasedAdapter(str(tmp_path / "config.yaml")).load_events()
+
+    assert sorted(e.event_type for e in events) == ["latency_spike", "request_failure"]
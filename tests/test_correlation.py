@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.pattern_detection.correlation_basic import CorrelationPatternDetector
+from core.schemas.normalized_event import NormalizedEvent
+
+
+GRAPH = {
+    "service-A": ["service-B"],
+    "service-B": ["service-C"],
+    "service-C": [],
+    "service-D": ["service-E"],
+    "service-E": [],
+}
+
+
+def _event(entity):
+    now = datetime(2025, 1, 1, 9, 45)
+    return NormalizedEvent(
+        normalized_event_id=str(uuid.uuid4()),
+        entity=entity,
+        failure_type="latency_degradation",
+        severity="medium",
+        time_window_start=now - timedelta(seconds=30),
+        time_window_end=now + timedelta(seconds=30),
+        dimensions={},
+        raw_event_ids=[],
+    )
+
+
+def _by_root(patterns):
+    return {p.description.split()[-1]: p for p in patterns}
+
+
+def test_one_pattern_per_candidate_root():
+    events = [_event(e) for e in ("service-A", "service-B", "service-C")]
+    patterns = CorrelationPatternDetector(GRAPH).detect(events)
+
+    roots = _by_root(patterns)
+    assert sorted(roots) == ["service-B", "service-C"]
+    assert len(patterns) == 2
+    assert "service-A (2 hops)" in roots["service-C"].description
+    assert set(roots["service-C"].supporting_event_ids) == {
+        e.normalized_event_id for e in events
+    }
+
+
+def test_more_failing_downstreams_outrank_fewer():
+    events = [_event(e) for e in ("service-A", "service-B", "service-C")]
+    roots = _by_root(CorrelationPatternDetector(GRAPH).detect(events))
+
+    # service-C: B at 1 hop and A at 2 hops; service-B: only A at 1 hop.
+    assert roots["service-C"].confidence == pytest.approx(1 - 0.4 * 0.7)
+    assert roots["service-B"].confidence == pytest.approx(0.6)
+    assert roots["service-C"].confidence > roots["service-B"].confidence
+
+
+def test_closer_downstream_outranks_farther():
+    events = [_event(e) for e in ("service-A", "service-C", "service-D", "service-E")]
+    roots = _by_root(CorrelationPatternDetector(GRAPH).detect(events))
+
+    # service-E is hit at 1 hop, service-C only at 2 hops.
+    assert roots["service-E"].confidence > roots["service-C"].confidence
+
+
+def test_max_hops_bounds_search():
+    events = [_event("service-A"), _event("service-C")]
+    patterns = CorrelationPatternDetector(GRAPH, max_hops=1).detect(events)
+
+    assert patterns == []
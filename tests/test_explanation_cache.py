@@ -0,0 +1,112 @@
+import uuid
+
+import pytest
+
+from core.memory.repository import MemoryRepository
+from core.reasoning.explanation_cache import CachedReasoner, ExplanationCache
+from core.reasoning.explanation_reasoner import ExplanationReasoner
+from core.schemas.evidence import Evidence
+from core.schemas.hypothesis import Hypothesis
+
+
+class StubReasoner:
+    def __init__(self):
+        self.calls = 0
+
+    def explain(self, ranked_results, evidences):
+        self.calls += 1
+        return f"stub: {ranked_results[0][1].description}"
+
+
+def _incident(entity, score=0.5):
+    hypothesis = Hypothesis(
+        hypothesis_id=str(uuid.uuid4()),
+        category="service_degradation",
+        description=f"Service {entity} experienced internal degradation",
+        generated_by="rules",
+        related_pattern_ids=[],
+    )
+    evidence = Evidence(
+        hypothesis_id=hypothesis.hypothesis_id,
+        temporal_alignment=0.6,
+        correlation_strength=0.0,
+        causal_proximity=0.5,
+        signal_confidence=0.6,
+        facts=[f"Multiple failures close in time for {entity}"],
+    )
+    return [(1, hypothesis, score)], [evidence]
+
+
+@pytest.fixture
+def memory():
+    return MemoryRepository(":memory:")
+
+
+def test_same_signature_hits_cache():
+    stub = StubReasoner()
+    reasoner = CachedReasoner(stub)
+
+    first = reasoner.explain(*_incident("service-A"))
+    # Fresh hypothesis ids, same root-cause signature.
+    second = reasoner.explain(*_incident("service-A"))
+
+    assert first == second
+    assert stub.calls == 1
+    assert (reasoner.cache.hits, reasoner.cache.misses) == (1, 1)
+
+
+def test_different_signature_misses_cache():
+    stub = StubReasoner()
+    reasoner = CachedReasoner(stub)
+
+    reasoner.explain(*_incident("service-A"))
+    reasoner.explain(*_incident("service-B"))
+    reasoner.explain(*_incident("service-A", score=0.9))
+
+    assert stub.calls == 3
+    assert reasoner.cache.misses == 3
+
+
+def test_lru_evicts_least_recently_used():
+    stub = StubReasoner()
+    reasoner = CachedReasoner(stub, ExplanationCache(max_size=2))
+
+    reasoner.explain(*_incident("service-A"))
+    reasoner.explain(*_incident("service-B"))
+    reasoner.explain(*_incident("service-A"))  # refresh A
+    reasoner.explain(*_incident("service-C"))  # evicts B
+    assert stub.calls == 3
+
+    reasoner.explain(*_incident("service-A"))
+    assert stub.calls == 3
+    reasoner.explain(*_incident("service-B"))
+    assert stub.calls == 4
+
+
+def test_persistent_tier_survives_fresh_cache(memory):
+    first = StubReasoner()
+    CachedReasoner(first, ExplanationCache(memory_repo=memory)).explain(
+        *_incident("service-A")
+    )
+
+    second = StubReasoner()
+    cache = ExplanationCache(memory_repo=memory)
+    explanation = CachedReasoner(second, cache).explain(*_incident("service-A"))
+
+    assert explanation == "stub: Service service-A experienced internal degradation"
+    assert second.calls == 0
+    assert cache.hits == 1
+
+
+def test_swapped_reasoner_does_not_reuse_text(memory):
+    CachedReasoner(
+        ExplanationReasoner(), ExplanationCache(memory_repo=memory)
+    ).explain(*_incident("service-A"))
+
+    stub = StubReasoner()
+    explanation = CachedReasoner(
+        stub, ExplanationCache(memory_repo=memory)
+    ).explain(*_incident("service-A"))
+
+    assert explanation.startswith("stub:")
+    assert stub.calls == 1